@@ -1,10 +1,21 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.feather as pa_feather
+import os
+import re
+import tempfile
 from pathlib import Path
 
 # --------- Config ---------
 DATA_PATH = Path("data/jobs_latest.csv")  # rename your file to this or adjust path
 MAX_ROWS = 6000  # hard cap for displayed jobs
+# Bump whenever read_jobs changes the columns/dtypes it produces, so stale
+# on-disk caches (data/jobs_latest.v<N>.feather) are ignored.
+CACHE_VERSION = 4
 
 st.set_page_config(
     page_title="Remote/Hybrid Jobs Viewer",
@@ -83,22 +94,222 @@ SENIORITY_LABELS = {
     "c_level": "C-level",
 }
 
+
+def pretty_labels(col: pd.Series, labels: dict) -> pd.Series:
+    # map() on a categorical relabels its few categories, not every row
+    return (
+        col.map(lambda v: labels.get(v, v))
+        .astype(pd.ArrowDtype(pa.string()))
+        .fillna("")
+    )
+
+
+def text_contains(col: pd.Series, needle: str) -> np.ndarray:
+    # Arrow-backed text: scan the contiguous UTF-8 buffer with Arrow's kernel
+    # (pa.array() on the column is zero-copy); missing values never match
+    if isinstance(col.dtype, pd.ArrowDtype):
+        hits = pc.match_substring(pa.array(col), needle)
+        return pc.fill_null(hits, False).to_numpy(zero_copy_only=False)
+    return col.str.contains(needle, regex=False, na=False).to_numpy()
+
+
+def text_contains_any(col: pd.Series, needles: list) -> np.ndarray:
+    # Several terms: one pass over an alternation of escaped literals, which
+    # RE2 compiles into a single automaton instead of one scan per term
+    if len(needles) == 1:
+        return text_contains(col, needles[0])
+    pattern = "|".join(re.escape(n) for n in needles)
+    if isinstance(col.dtype, pd.ArrowDtype):
+        hits = pc.match_substring_regex(pa.array(col), pattern)
+        return pc.fill_null(hits, False).to_numpy(zero_copy_only=False)
+    return col.str.contains(pattern, regex=True, na=False).to_numpy()
+
+
+def is_noop_filter(selected: frozenset, key: str, options: dict) -> bool:
+    # Nothing selected, or every option of a column that has no other values
+    return not selected or (
+        key in options["complete"] and len(selected) == len(options[key])
+    )
+
+
+TECH_COLS = [
+    "tech_stack.languages",
+    "tech_stack.frameworks",
+    "tech_stack.data",
+    "tech_stack.cloud",
+    "tech_stack.ml",
+]
+
+# Few distinct values each: stored as categoricals (int codes + small
+# categories array), which makes .isin()/.unique() cheap
+CATEGORY_COLS = [
+    "seniority_norm",
+    "job_type",
+    "remote_policy",
+    "timezone_overlap",
+    "company",
+    "source",
+]
+
+# Everything the filters read: search text (lowercased) + categoricals
+FILTER_COLS = [
+    "title_lc",
+    "location_lc",
+    "tech_all_lc",
+    "company",
+    "seniority_norm",
+    "job_type",
+    "remote_policy",
+    "timezone_overlap",
+]
+
+# Raw columns behind the table (the pretty labels are derived from them)
+DISPLAY_SOURCE_COLS = [
+    "title",
+    "company",
+    "location",
+    "seniority_norm",
+    "job_type",
+    "remote_policy",
+    "timezone_overlap",
+    "posted_date",
+    "source",
+    "link",
+]
+
+# --------- Table layout (static) ---------
+DISPLAY_COLS = [
+    "title",
+    "company",
+    "location",
+    "seniority_pretty",
+    "job_type",
+    "remote_policy_pretty",
+    "timezone_overlap",
+    "posted_date",
+    "source",
+    "link",
+]
+
+COL_LABELS = {
+    "title": "Job title",
+    "company": "Company",
+    "location": "Location",
+    "seniority_pretty": "Seniority",
+    "job_type": "Job type",
+    "remote_policy_pretty": "Remote policy",
+    "timezone_overlap": "Timezone overlap",
+    "posted_date": "Posted",
+    "source": "Source",
+    "link": "Apply / Job link",
+}
+
+COLUMN_CONFIG = {
+    col: (
+        st.column_config.LinkColumn(COL_LABELS[col])
+        if col == "link"
+        else st.column_config.TextColumn(COL_LABELS[col])
+    )
+    for col in DISPLAY_COLS
+}
+
 # --------- Data loader ---------
-@st.cache_data
-def load_jobs(path: Path, file_mtime: float) -> pd.DataFrame:
-    # Your CSV uses ';' as delimiter
-    df = pd.read_csv(path, sep=";")
+# Typed schema for the CSV: Arrow parses these in the same pass as the split,
+# so no pd.to_numeric / pd.to_datetime re-coercion is needed afterwards.
+CSV_COLUMN_TYPES = {
+    "salary_min": pa.float64(),
+    "salary_max": pa.float64(),
+    "salary_annual_min": pa.float64(),
+    "salary_annual_max": pa.float64(),
+    "posted_at": pa.timestamp("ns", tz="UTC"),
+    # Text the app reads stays text even when a snapshot leaves the column
+    # empty (inference would give Arrow's null type, which breaks
+    # .str / category ops)
+    **{
+        col: pa.string()
+        for col in ["title", "location", "link", *CATEGORY_COLS, *TECH_COLS]
+    },
+}
 
-    # Coerce salary columns to numeric (still useful for later, but not shown)
-    for col in ["salary_min", "salary_max", "salary_annual_min", "salary_annual_max"]:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
 
-    # Try to parse posted_at as datetime for sorting + create nice date string
+def read_jobs_csv(path: Path) -> pd.DataFrame:
+    # Your CSV uses ';' as delimiter; empty cells become nulls like in pandas.
+    # Quoted cells may contain line breaks (scraped titles/locations), which
+    # pyarrow only accepts when asked to
+    parse_options = pa_csv.ParseOptions(
+        delimiter=";", double_quote=True, newlines_in_values=True
+    )
+    convert_options = pa_csv.ConvertOptions(
+        column_types=CSV_COLUMN_TYPES,
+        strings_can_be_null=True,
+    )
+    try:
+        table = pa_csv.read_csv(
+            path, parse_options=parse_options, convert_options=convert_options
+        )
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    except pa.ArrowInvalid as err:
+        # Structural parse errors (column counts, quoting) can't be fixed by
+        # re-reading: let them surface once, with their own traceback
+        if "CSV conversion error" not in str(err):
+            raise
+        # Some value Arrow can't convert (e.g. salary "$100k", malformed
+        # posted_at): read the typed columns as text and coerce bad values to
+        # NaN/NaT like pd.to_numeric / pd.to_datetime(errors="coerce") did
+        convert_options.column_types = {col: pa.string() for col in CSV_COLUMN_TYPES}
+        table = pa_csv.read_csv(
+            path, parse_options=parse_options, convert_options=convert_options
+        )
+        df = table.to_pandas(types_mapper=pd.ArrowDtype)
+        for col, arrow_type in CSV_COLUMN_TYPES.items():
+            if col not in df.columns or pa.types.is_string(arrow_type):
+                continue
+            if pa.types.is_timestamp(arrow_type):
+                try:
+                    # Vectorized ISO-8601 path instead of per-value format guessing
+                    df[col] = pd.to_datetime(df[col], format="ISO8601", utc=True)
+                except (ValueError, TypeError):
+                    df[col] = pd.to_datetime(df[col], errors="coerce", utc=True)
+            else:
+                # via object: on Arrow strings, errors="coerce" yields NaN, not null
+                df[col] = pd.to_numeric(df[col].astype(object), errors="coerce")
+            # Same Arrow dtypes as the fast path (NaN/NaT -> null)
+            df[col] = df[col].astype(pd.ArrowDtype(arrow_type))
+        return df
+
+
+def arrow_dtype(arrow_type: pa.DataType):
+    # Dictionary columns come back as pandas categoricals, the rest Arrow-backed
+    if pa.types.is_dictionary(arrow_type):
+        return None
+    return pd.ArrowDtype(arrow_type)
+
+
+def read_jobs(path: Path, file_mtime: float) -> pd.DataFrame:
+    # Processed snapshot saved next to the CSV (Arrow IPC), so a fresh
+    # process or container restart skips CSV parsing entirely
+    cache_path = path.with_suffix(f".v{CACHE_VERSION}.feather")
+    if cache_path.exists() and cache_path.stat().st_mtime >= file_mtime:
+        try:
+            table = pa_feather.read_table(cache_path)
+            return table.to_pandas(types_mapper=arrow_dtype)
+        except (pa.ArrowInvalid, OSError):
+            pass  # unreadable cache (e.g. truncated): rebuild it from the CSV
+
+    df = read_jobs_csv(path)
+
+    # posted_at is already a timestamp: sort on it + create nice date string
+    # (Arrow casts timestamp -> date -> "YYYY-MM-DD", no per-row strftime)
     if "posted_at" in df.columns:
-        df["posted_at_dt"] = pd.to_datetime(df["posted_at"], errors="coerce", utc=True)
-        df = df.sort_values("posted_at_dt", ascending=False)
-        df["posted_date"] = df["posted_at_dt"].dt.strftime("%Y-%m-%d")
+        # Convention for whatever writes the CSV: rows newest-first by
+        # posted_at, so read_jobs can skip this sort
+        if not df["posted_at"].is_monotonic_decreasing:
+            df = df.sort_values("posted_at", ascending=False, kind="stable")
+        df["posted_date"] = (
+            df["posted_at"]
+            .astype(pd.ArrowDtype(pa.date32()))
+            .astype(pd.ArrowDtype(pa.string()))
+        )
     else:
         df["posted_date"] = ""
 
@@ -109,17 +320,112 @@ def load_jobs(path: Path, file_mtime: float) -> pd.DataFrame:
         "remote_policy",
         "timezone_overlap",
         "job_type",
-        "tech_stack.languages",
-        "tech_stack.frameworks",
-        "tech_stack.data",
-        "tech_stack.cloud",
-        "tech_stack.ml",
+        *TECH_COLS,
     ]:
         if col not in df.columns:
-            df[col] = ""
+            df[col] = pd.Series("", index=df.index, dtype=pd.ArrowDtype(pa.string()))
+
+    for col in CATEGORY_COLS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+
+    # Lowercased copies of the searchable text, so the text filters don't
+    # lowercase the whole column again on every rerun (not displayed)
+    # A snapshot without the column just never matches that search
+    for col in ("title", "location"):
+        if col in df.columns:
+            df[f"{col}_lc"] = df[col].fillna("").str.lower()
+        else:
+            df[f"{col}_lc"] = pd.Series(
+                "", index=df.index, dtype=pd.ArrowDtype(pa.string())
+            )
+    # All tech columns in one string, joined column-wise by Arrow (no per-row
+    # Python loop); \x1f can't be typed into the search box, so a match never
+    # spans two columns
+    tech_all = pc.binary_join_element_wise(
+        *(pa.array(df[col].astype(pd.ArrowDtype(pa.string()))) for col in TECH_COLS),
+        "\x1f",
+        null_handling="replace",
+        null_replacement="",
+    )
+    df["tech_all_lc"] = pd.Series(
+        pd.arrays.ArrowExtensionArray(pc.utf8_lower(tech_all)), index=df.index
+    )
+
+    df = df.reset_index(drop=True)
+    # Write to a temp file + rename, so a killed process or two workers
+    # writing at once never leave a half-written cache at cache_path
+    try:
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=f"{cache_path.name}.", suffix=".tmp", dir=cache_path.parent
+        )
+    except OSError:
+        pass  # read-only deploy: just skip the on-disk cache
+    else:
+        os.close(fd)
+        try:
+            df.to_feather(tmp_name, compression="zstd")
+            os.replace(tmp_name, cache_path)
+        except OSError:
+            pass  # e.g. disk full: the app still runs from the CSV
+        finally:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
 
     return df
 
+
+def filter_options(df: pd.DataFrame) -> dict:
+    def non_empty(col: str) -> list:
+        return sorted(s for s in df[col].dropna().unique() if str(s).strip())
+
+    columns = {
+        "seniority": "seniority_norm",
+        "job_type": "job_type",
+        "remote": "remote_policy",
+        "company": "company",
+        "tz": "timezone_overlap",
+    }
+    options = {key: non_empty(col) for key, col in columns.items()}
+    options["seniority"] = [
+        s for s in options["seniority"] if str(s).lower() != "unspecified"
+    ]
+    options["tz_human"] = [
+        f"{tz} — {TIMEZONE_DETAILS.get(tz, 'Unknown timezone')}"
+        for tz in options["tz"]
+    ]
+    # Filters whose options cover every row (no blanks / hidden values), so
+    # selecting all of them filters nothing
+    options["complete"] = {
+        key for key, col in columns.items() if df[col].isin(options[key]).all()
+    }
+    return options
+
+
+@st.cache_data
+def load_jobs(
+    path: Path, file_mtime: float
+) -> tuple[pd.DataFrame, pd.DataFrame, dict]:
+    # Returns (filter_df, display_df, options): the filters only ever touch
+    # the narrow filter_df, the table only row-slices display_df, and the
+    # sidebar option lists are built once per snapshot
+    df = read_jobs(path, file_mtime)
+    filter_df = df[[c for c in FILTER_COLS if c in df.columns]]
+
+    # Only the columns the table needs, so selecting the shown rows copies
+    # ~10 columns instead of all of them
+    display_df = df[[c for c in DISPLAY_SOURCE_COLS if c in df.columns]]
+    # Pretty labels + Arrow string dtypes for the table, done once per
+    # snapshot instead of on every rerun (Arrow strings also keep the
+    # st.cache_data unpickle on each rerun cheap); the raw label columns
+    # aren't shown, so they're dropped
+    display_df = display_df.assign(
+        remote_policy_pretty=pretty_labels(display_df["remote_policy"], REMOTE_LABELS),
+        seniority_pretty=pretty_labels(display_df["seniority_norm"], SENIORITY_LABELS),
+    ).drop(columns=["remote_policy", "seniority_norm"])
+    display_df = display_df.astype(pd.ArrowDtype(pa.string()))
+    return filter_df, display_df, filter_options(filter_df)
+
 # --------- Load data ---------
 if not DATA_PATH.exists():
     st.error(
@@ -130,7 +436,7 @@ if not DATA_PATH.exists():
     st.stop()
 
 file_mtime = DATA_PATH.stat().st_mtime  # changes whenever the CSV is updated
-df = load_jobs(DATA_PATH, file_mtime)
+filter_df, display_df, options = load_jobs(DATA_PATH, file_mtime)
 
 # --------- Header ---------
 st.title("🌐 Remote/Hybrid Jobs Viewer")
@@ -140,7 +446,7 @@ st.caption(
 )
 st.caption("📅 Dates shown as **YYYY-MM-DD**.")
 
-total_snapshot = len(df)
+total_snapshot = len(filter_df)
 st.write(f"Total jobs in this snapshot (before filters): **{total_snapshot}**")
 
 st.markdown(
@@ -155,31 +461,11 @@ Open the full dashboard directly in your browser:
 
 
 # --------- Prepare filter option lists (shared) ---------
-seniority_options = sorted(
-    s
-    for s in df["seniority_norm"].dropna().unique()
-    if str(s).strip() and str(s).lower() != "unspecified"
-)
-
-job_type_options = sorted(
-    s for s in df["job_type"].dropna().unique() if str(s).strip()
-)
-
-remote_options = sorted(
-    s for s in df["remote_policy"].dropna().unique() if str(s).strip()
-)
-
-company_options = sorted(
-    s for s in df["company"].dropna().unique() if str(s).strip()
-)
-
-tz_options = sorted(
-    s for s in df["timezone_overlap"].dropna().unique() if str(s).strip()
-)
-tz_options_human = [
-    f"{tz} — {TIMEZONE_DETAILS.get(tz, 'Unknown timezone')}"
-    for tz in tz_options
-]
+seniority_options = options["seniority"]
+job_type_options = options["job_type"]
+remote_options = options["remote"]
+company_options = options["company"]
+tz_options_human = options["tz_human"]
 
 # --------- Layout selector (PC vs Mobile) ---------
 layout_mode = st.radio(
@@ -244,7 +530,11 @@ if layout_mode.startswith("🖥️"):
     )
     selected_tz = [tz.split(" — ")[0] for tz in selected_tz_human]
 
-    tech_q = st.sidebar.text_input("Tech stack contains", "")
+    tech_q = st.sidebar.text_input(
+        "Tech stack contains",
+        "",
+        help="Separate technologies with commas to match any of them, e.g. python, rust.",
+    )
 
 else:
     # MOBILE: filters in an expander on the main page
@@ -290,60 +580,67 @@ else:
         )
         selected_tz = [tz.split(" — ")[0] for tz in selected_tz_human]
 
-        tech_q = st.text_input("Tech stack contains", "")
+        tech_q = st.text_input(
+            "Tech stack contains",
+            "",
+            help="Separate technologies with commas to match any of them, e.g. python, rust.",
+        )
 
 # --------- Apply filters ---------
-filtered = df.copy()
+# One boolean mask for all filters, rows are copied out once at the end
+mask = np.ones(len(filter_df), dtype=bool)
+
+# Multiselect picks (either layout) as frozensets, ready-made sets for isin()
+selected_companies = frozenset(selected_companies)
+selected_seniority = frozenset(selected_seniority)
+selected_job_types = frozenset(selected_job_types)
+selected_remote = frozenset(selected_remote)
+selected_tz = frozenset(selected_tz)
+
+# Whitespace-only searches would otherwise scan every row for nothing
+q = q.strip()
+location_q = location_q.strip()
+tech_q = tech_q.strip()
 
 if q:
     q_low = q.lower()
-    filtered = filtered[
-        filtered["title"].fillna("").str.lower().str.contains(q_low)
-    ]
+    mask &= text_contains(filter_df["title_lc"], q_low)
 
-if selected_companies:
-    filtered = filtered[filtered["company"].isin(selected_companies)]
+if not is_noop_filter(selected_companies, "company", options):
+    mask &= filter_df["company"].isin(selected_companies).to_numpy()
 
-if selected_seniority:
-    filtered = filtered[filtered["seniority_norm"].isin(selected_seniority)]
+if not is_noop_filter(selected_seniority, "seniority", options):
+    mask &= filter_df["seniority_norm"].isin(selected_seniority).to_numpy()
 
-if selected_job_types:
-    filtered = filtered[filtered["job_type"].isin(selected_job_types)]
+if not is_noop_filter(selected_job_types, "job_type", options):
+    mask &= filter_df["job_type"].isin(selected_job_types).to_numpy()
 
-if selected_remote:
-    filtered = filtered[filtered["remote_policy"].isin(selected_remote)]
+if not is_noop_filter(selected_remote, "remote", options):
+    mask &= filter_df["remote_policy"].isin(selected_remote).to_numpy()
 
 if location_q:
     loc_low = location_q.lower()
-    filtered = filtered[
-        filtered["location"].fillna("").str.lower().str.contains(loc_low)
-    ]
+    mask &= text_contains(filter_df["location_lc"], loc_low)
 
-if selected_tz:
-    filtered = filtered[filtered["timezone_overlap"].isin(selected_tz)]
-
-if tech_q:
-    t = tech_q.lower()
-    tech_cols = [
-        "tech_stack.languages",
-        "tech_stack.frameworks",
-        "tech_stack.data",
-        "tech_stack.cloud",
-        "tech_stack.ml",
-    ]
-    mask = False
-    for col in tech_cols:
-        mask = mask | filtered[col].fillna("").str.lower().str.contains(t)
-    filtered = filtered[mask]
+if not is_noop_filter(selected_tz, "tz", options):
+    mask &= filter_df["timezone_overlap"].isin(selected_tz).to_numpy()
+
+# "python, rust" matches jobs listing either technology
+tech_terms = [t.strip() for t in tech_q.lower().split(",") if t.strip()]
+if tech_terms:
+    mask &= text_contains_any(filter_df["tech_all_lc"], tech_terms)
+
+matched = np.flatnonzero(mask)
 
 # ---- Limit to MAX_ROWS for display ----
-total_after_filters = len(filtered)
+total_after_filters = len(matched)
 # if total_after_filters > MAX_ROWS:
 #     st.warning(
 #         f"Filters matched **{total_after_filters}** jobs. "
 #         f"Showing only the first **{MAX_ROWS}**."
 #     )
-shown = filtered.head(MAX_ROWS).copy()
+# Positional take of just the displayed rows, with a fresh 0..n-1 index
+shown = display_df.iloc[matched[:MAX_ROWS]].reset_index(drop=True)
 
 # Info sobre o resultado após filtros e limite
 st.write(f"Jobs shown after filters: **{len(shown)}**")
@@ -356,67 +653,9 @@ if total_after_filters > MAX_ROWS:
     )
 
 # --------- Table display ---------
-shown["remote_policy"] = shown["remote_policy"].astype("string")
-shown["seniority_norm"] = shown["seniority_norm"].astype("string")
-
-shown["remote_policy_pretty"] = (
-    shown["remote_policy"]
-    .map(REMOTE_LABELS)
-    .fillna(shown["remote_policy"])
-    .fillna("")
-    .astype("string")
-)
-
-shown["seniority_pretty"] = (
-    shown["seniority_norm"]
-    .map(SENIORITY_LABELS)
-    .fillna(shown["seniority_norm"])
-    .fillna("")
-    .astype("string")
-)
-
-display_cols = [
-    "title",
-    "company",
-    "location",
-    "seniority_pretty",
-    "job_type",
-    "remote_policy_pretty",
-    "timezone_overlap",
-    "posted_date",
-    "source",
-    "link",
-]
-
-existing_cols = [c for c in display_cols if c in shown.columns]
-
-# Coerce all display columns (except link/posted_date) to string
-for col in existing_cols:
-    if col not in ("link", "posted_date"):
-        shown[col] = shown[col].astype("string")
-
-col_labels = {
-    "title": "Job title",
-    "company": "Company",
-    "location": "Location",
-    "seniority_pretty": "Seniority",
-    "job_type": "Job type",
-    "remote_policy_pretty": "Remote policy",
-    "timezone_overlap": "Timezone overlap",
-    "posted_date": "Posted",
-    "source": "Source",
-    "link": "Apply / Job link",
-}
-
-column_config = {
-    "link": st.column_config.LinkColumn(col_labels["link"]),
-    "posted_date": st.column_config.TextColumn(col_labels["posted_date"]),
-}
-
-for col in existing_cols:
-    if col not in column_config:
-        label = col_labels.get(col, col)
-        column_config[col] = st.column_config.TextColumn(label)
+# Display columns are already strings (see load_jobs)
+existing_cols = [c for c in DISPLAY_COLS if c in shown.columns]
+column_config = {c: COLUMN_CONFIG[c] for c in existing_cols}
 
 st.data_editor(
     shown[existing_cols],